@@ -15,6 +15,7 @@ import sys
 import time
 import urllib.error
 import urllib.request
+from datetime import datetime, timezone
 
 from . import VERSION
 from .compliance import ComplianceEngine
@@ -123,23 +124,31 @@ def is_valid_k8s_name(name: str) -> bool:
     return bool(name) and len(name) <= 253 and bool(re.match(r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?$", name))
 
 
-def compute_age(timestamp: str, now_epoch: float) -> int | None:
-    """Compute age in seconds, clamping to 0 on clock skew. Returns None on parse failure."""
-    import email.utils
-    from datetime import datetime, timezone
-
-    # Try ISO 8601 format first (K8s timestamps)
-    for fmt in ("%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%dT%H:%M:%S%z"):
+def _parse_k8s_time(timestamp: str) -> datetime | None:
+    """Parse a K8s RFC 3339 timestamp into an aware datetime. Returns None on failure."""
+    # fromisoformat is C-implemented and far cheaper than strptime, but before
+    # Python 3.11 it rejects a trailing "Z", so map that to +00:00 first.
+    if timestamp.endswith("Z"):
+        timestamp = timestamp[:-1] + "+00:00"
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except ValueError:
         try:
-            dt = datetime.strptime(timestamp, fmt)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=timezone.utc)
-            epoch = dt.timestamp()
-            age = int(now_epoch - epoch)
-            return max(age, 0)
+            dt = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S%z")  # e.g. +0000
         except ValueError:
-            continue
-    return None
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def compute_age(timestamp: str, now_epoch: float) -> int | None:
+    """Compute age in seconds, clamping to 0 on clock skew. Returns None on parse failure."""
+    dt = _parse_k8s_time(timestamp)
+    if dt is None:
+        return None
+    age = int(now_epoch - dt.timestamp())
+    return max(age, 0)
 
 
 def format_age_hours(age_secs: int | None) -> str:
@@ -167,14 +176,10 @@ def format_max_age_display(seconds: int) -> str:
 
 def _format_display_time(timestamp: str) -> str:
     """Format K8s timestamp for display."""
-    from datetime import datetime, timezone
-    try:
-        dt = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ")
-        dt = dt.replace(tzinfo=timezone.utc)
-        local_dt = dt.astimezone()
-        return local_dt.strftime("%a %b %d %Y %I:%M %p")
-    except ValueError:
+    dt = _parse_k8s_time(timestamp)
+    if dt is None:
         return timestamp
+    return dt.astimezone().strftime("%a %b %d %Y %I:%M %p")
 
 
 def _get_policy_namespaces(policy: dict) -> str:
@@ -234,6 +239,23 @@ def _get_policy_action_verbs(policy: dict) -> list[str]:
         return []
 
 
+def _policy_action_keys(policy: dict, pol_name: str, namespaces: list[str]) -> list[tuple[str, tuple[str, str, str]]]:
+    """Build (verb, action index key) pairs for a policy's configured actions."""
+    keys = []
+    for verb in _get_policy_action_verbs(policy):
+        resource = ACTION_VERB_MAP.get(verb, "")
+        if not resource:
+            continue
+        for search_ns in namespaces:
+            keys.append((verb, (resource, search_ns, pol_name)))
+    return keys
+
+
+def _by_creation(actions: list[dict]) -> list[dict]:
+    """Actions oldest first (RFC 3339 UTC timestamps sort lexically)."""
+    return sorted(actions, key=lambda a: a.get("metadata", {}).get("creationTimestamp", ""))
+
+
 # ======================================================================
 # Webhook notifications
 # ======================================================================
@@ -294,6 +316,34 @@ class BackupMonitor:
         self._now_epoch = time.time()
         self._webhook_url = webhook_url
 
+    # ------------------------------------------------------------------
+    # Policy action index
+    # ------------------------------------------------------------------
+    def _index_policy_actions(self, policies: list[dict],
+                              action_types: list[str]) -> dict[tuple[str, str, str], list[dict]]:
+        """List each action type once per namespace any policy targets.
+
+        Returns {(action_type, namespace, policy_name): [actions]} in list
+        order, so per-policy lookups need no further kubectl calls.
+        """
+        namespaces = list(dict.fromkeys(
+            ns for p in policies for ns in build_namespace_list(_get_policy_namespaces(p))
+        ))
+        listings = [(t, ns) for t in action_types for ns in namespaces]
+        results = self._kc.get_json_many([
+            ["get", t, "-n", ns, "-l", "k10.kasten.io/policyName"]
+            for t, ns in listings
+        ])
+        index: dict[tuple[str, str, str], list[dict]] = {}
+        for (t, ns), data in zip(listings, results):
+            if not data:
+                continue
+            for item in data.get("items", []):
+                labels = item.get("metadata", {}).get("labels") or {}
+                pol_name = labels.get("k10.kasten.io/policyName", "")
+                index.setdefault((t, ns, pol_name), []).append(item)
+        return index
+
     # ------------------------------------------------------------------
     # Check mode — policy status dashboard
     # ------------------------------------------------------------------
@@ -323,30 +373,24 @@ class BackupMonitor:
         count_norun = 0
         shown = 0
 
+        # One listing per action type/namespace for all policies; the same
+        # objects drive the active check, latest run and detail lines below.
+        index = self._index_policy_actions(items, ACTION_TYPES)
+
         for policy in items:
             pol_name = policy.get("metadata", {}).get("name", "")
             pol_ns = _get_policy_namespaces(policy)
             pol_actions = _get_policy_actions_display(policy)
             target_namespaces = build_namespace_list(pol_ns)
 
-            # Check for active actions
-            has_active = False
-            for action_type in ACTION_TYPES:
-                for check_ns in target_namespaces:
-                    lines = self._kc.get_lines([
-                        "get", action_type, "-n", check_ns,
-                        "-l", f"k10.kasten.io/policyName={pol_name}",
-                        "--no-headers",
-                    ])
-                    for line in lines:
-                        parts = line.split()
-                        if parts and parts[-1] in _TARGET_STATES:
-                            has_active = True
-                            break
-                    if has_active:
-                        break
-                if has_active:
-                    break
+            active_actions = [  # (kind, action object) in target states
+                (KIND_MAP[action_type], item)
+                for action_type in ACTION_TYPES
+                for check_ns in target_namespaces
+                for item in index.get((action_type, check_ns, pol_name), [])
+                if item.get("status", {}).get("state", "") in _TARGET_STATES
+            ]
+            has_active = bool(active_actions)
 
             # Find most recent action and any skipped/failed within max-age window
             latest_time = ""
@@ -354,42 +398,34 @@ class BackupMonitor:
             latest_error = ""
             recent_issues = []  # (time, status, error) for non-Complete within window
 
-            for verb in _get_policy_action_verbs(policy):
-                resource = ACTION_VERB_MAP.get(verb, "")
-                if not resource:
+            for _, key in _policy_action_keys(policy, pol_name, target_namespaces):
+                action_items = _by_creation(index.get(key, []))
+                if not action_items:
                     continue
-                for search_ns in target_namespaces:
-                    data = self._kc.get_json([
-                        "get", resource, "-n", search_ns,
-                        "-l", f"k10.kasten.io/policyName={pol_name}",
-                        "--sort-by=.metadata.creationTimestamp",
-                    ])
-                    if not data:
+                last = action_items[-1]
+                act_time = last.get("metadata", {}).get("creationTimestamp", "")
+                if not act_time:
+                    continue
+                if not latest_time or act_time > latest_time:
+                    last_status = last.get("status", {})
+                    latest_time = act_time
+                    latest_status = last_status.get("state", "Unknown")
+                    latest_error = _safe_error_message(last_status)
+
+                # Scan all actions in the window for skipped/failed. The state
+                # test is a dict lookup, so do it before parsing the timestamp.
+                for item in action_items:
+                    item_status = item.get("status", {})
+                    item_state = item_status.get("state", "")
+                    if item_state not in ("Skipped", "Failed"):
                         continue
-                    action_items = data.get("items", [])
-                    if not action_items:
+                    item_time = item.get("metadata", {}).get("creationTimestamp", "")
+                    if not item_time:
                         continue
-                    last = action_items[-1]
-                    act_time = last.get("metadata", {}).get("creationTimestamp", "")
-                    if not act_time:
+                    item_age = compute_age(item_time, self._now_epoch)
+                    if item_age is None or item_age > max_age_seconds:
                         continue
-                    if not latest_time or act_time > latest_time:
-                        latest_time = act_time
-                        latest_status = last.get("status", {}).get("state", "Unknown")
-                        latest_error = _safe_error_message(last.get("status", {}))
-
-                    # Scan all actions in the window for skipped/failed
-                    for item in action_items:
-                        item_time = item.get("metadata", {}).get("creationTimestamp", "")
-                        if not item_time:
-                            continue
-                        item_age = compute_age(item_time, self._now_epoch)
-                        if item_age is None or item_age > max_age_seconds:
-                            continue
-                        item_state = item.get("status", {}).get("state", "")
-                        if item_state in ("Skipped", "Failed"):
-                            item_err = _safe_error_message(item.get("status", {}))
-                            recent_issues.append((item_time, item_state, item_err))
+                    recent_issues.append((item_time, item_state, _safe_error_message(item_status)))
 
             if not latest_status:
                 latest_status = "\u2014"
@@ -454,78 +490,58 @@ class BackupMonitor:
                         print(f"    error: {issue_err}")
 
             # Show active actions for this policy
-            for action_type in ACTION_TYPES:
-                kind = KIND_MAP[action_type]
-                for search_ns in target_namespaces:
-                    lines = self._kc.get_lines([
-                        "get", action_type, "-n", search_ns,
-                        "-l", f"k10.kasten.io/policyName={pol_name}",
-                        "--no-headers",
-                        "-o", "custom-columns=NAME:.metadata.name,STATUS:.status.state,NS:.metadata.namespace",
-                    ])
-                    for line in lines:
-                        parts = line.split()
-                        if len(parts) < 3:
-                            continue
-                        act_name, act_status_raw, act_ns = parts[0], parts[1], parts[2]
-                        if act_status_raw not in _TARGET_STATES:
-                            continue
-
-                        # Get full action JSON
-                        act_data = self._kc.get_json([
-                            "get", action_type, act_name, "-n", act_ns,
-                        ])
-                        if not act_data:
-                            continue
-
-                        act_state = act_data.get("status", {}).get("state", "")
-                        act_creation = act_data.get("metadata", {}).get("creationTimestamp", "")
-                        act_start = act_data.get("status", {}).get("startTime", "")
-                        act_progress = act_data.get("status", {}).get("progress", "")
-                        act_err = _safe_error_message(act_data.get("status", {}))
-
-                        # Compute age
-                        if act_start and act_state == "Running":
-                            age_ref = act_start
-                        else:
-                            age_ref = act_creation
-
-                        act_age_hours = "?"
-                        act_is_old = False
-                        if age_ref:
-                            act_age_secs = compute_age(age_ref, self._now_epoch)
-                            if act_age_secs is not None:
-                                act_age_hours = str(act_age_secs // 3600)
-                                act_is_old = act_age_secs >= max_age_seconds
-
-                        # Health label
-                        signals = []
-                        if act_state == "Pending" and act_is_old:
-                            signals.append("old")
-                        elif act_state == "AttemptFailed":
-                            signals.append("retry-loop")
-                        elif act_state == "Running":
-                            if act_progress is not None and str(act_progress) == "0" and act_is_old:
-                                signals.append("no-progress")
-                            if act_err:
-                                signals.append("has-error")
-
-                        if act_is_old and signals:
-                            health = "STUCK"
-                        elif act_is_old:
-                            health = "OLD"
-                        else:
-                            health = "OK"
-
-                        progress_str = f" progress={act_progress}%" if act_progress not in (None, "") else " progress=\u2014"
-                        signal_str = f" ({', '.join(signals)})" if signals else ""
-
-                        print(
-                            f"  [{health:<5s}] {kind:<20s} {act_name:<40s} age={act_age_hours + 'h':<5s} "
-                            f"{act_state}{progress_str} policy={pol_name}{signal_str}"
-                        )
-                        if act_err:
-                            print(f"          error: {act_err}")
+            for kind, act_data in active_actions:
+                act_meta = act_data.get("metadata", {})
+                act_status = act_data.get("status", {})
+                act_name = act_meta.get("name", "")
+                act_state = act_status.get("state", "")
+                act_creation = act_meta.get("creationTimestamp", "")
+                act_start = act_status.get("startTime", "")
+                act_progress = act_status.get("progress", "")
+                act_err = _safe_error_message(act_status)
+
+                # Compute age
+                if act_start and act_state == "Running":
+                    age_ref = act_start
+                else:
+                    age_ref = act_creation
+
+                act_age_hours = "?"
+                act_is_old = False
+                if age_ref:
+                    act_age_secs = compute_age(age_ref, self._now_epoch)
+                    if act_age_secs is not None:
+                        act_age_hours = str(act_age_secs // 3600)
+                        act_is_old = act_age_secs >= max_age_seconds
+
+                # Health label
+                signals = []
+                if act_state == "Pending" and act_is_old:
+                    signals.append("old")
+                elif act_state == "AttemptFailed":
+                    signals.append("retry-loop")
+                elif act_state == "Running":
+                    if act_progress is not None and str(act_progress) == "0" and act_is_old:
+                        signals.append("no-progress")
+                    if act_err:
+                        signals.append("has-error")
+
+                if act_is_old and signals:
+                    health = "STUCK"
+                elif act_is_old:
+                    health = "OLD"
+                else:
+                    health = "OK"
+
+                progress_str = f" progress={act_progress}%" if act_progress not in (None, "") else " progress=\u2014"
+                signal_str = f" ({', '.join(signals)})" if signals else ""
+
+                print(
+                    f"  [{health:<5s}] {kind:<20s} {act_name:<40s} age={act_age_hours + 'h':<5s} "
+                    f"{act_state}{progress_str} policy={pol_name}{signal_str}"
+                )
+                if act_err:
+                    print(f"          error: {act_err}")
 
         if shown == 0:
             print("All policies healthy \u2014 nothing to report.")
@@ -583,6 +599,13 @@ class BackupMonitor:
         count_completed = 0
         shown = 0
 
+        verb_types = list(dict.fromkeys(
+            ACTION_VERB_MAP[verb]
+            for p in items for verb in _get_policy_action_verbs(p)
+            if verb in ACTION_VERB_MAP
+        ))
+        index = self._index_policy_actions(items, verb_types)
+
         for policy in items:
             pol_name = policy.get("metadata", {}).get("name", "")
             pol_ns = _get_policy_namespaces(policy)
@@ -592,29 +615,18 @@ class BackupMonitor:
             latest_status = ""
             latest_verb = ""
 
-            for verb in _get_policy_action_verbs(policy):
-                resource = ACTION_VERB_MAP.get(verb, "")
-                if not resource:
+            for verb, key in _policy_action_keys(policy, pol_name, target_namespaces):
+                action_items = _by_creation(index.get(key, []))
+                if not action_items:
                     continue
-                for search_ns in target_namespaces:
-                    data = self._kc.get_json([
-                        "get", resource, "-n", search_ns,
-                        "-l", f"k10.kasten.io/policyName={pol_name}",
-                        "--sort-by=.metadata.creationTimestamp",
-                    ])
-                    if not data:
-                        continue
-                    action_items = data.get("items", [])
-                    if not action_items:
-                        continue
-                    last = action_items[-1]
-                    act_time = last.get("metadata", {}).get("creationTimestamp", "")
-                    if not act_time:
-                        continue
-                    if not latest_time or act_time > latest_time:
-                        latest_time = act_time
-                        latest_status = last.get("status", {}).get("state", "Unknown")
-                        latest_verb = verb
+                last = action_items[-1]
+                act_time = last.get("metadata", {}).get("creationTimestamp", "")
+                if not act_time:
+                    continue
+                if not latest_time or act_time > latest_time:
+                    latest_time = act_time
+                    latest_status = last.get("status", {}).get("state", "Unknown")
+                    latest_verb = verb
 
             if latest_status != "Complete":
                 continue
@@ -657,13 +669,18 @@ class BackupMonitor:
         count_no_progress = 0
         count_error_signal = 0
 
-        for action_type in ACTION_TYPES:
-            kind = KIND_MAP[action_type]
-
-            lines = self._kc.get_lines([
+        # List every action type up front in parallel; each candidate is
+        # re-fetched below before acting on it, so staleness is harmless.
+        listings = self._kc.get_lines_many([
+            [
                 "get", action_type, "-n", NAMESPACE, "--no-headers",
                 "-o", "custom-columns=NAME:.metadata.name,STATUS:.status.state",
-            ])
+            ]
+            for action_type in ACTION_TYPES
+        ])
+
+        for action_type, lines in zip(ACTION_TYPES, listings):
+            kind = KIND_MAP[action_type]
 
             for line in lines:
                 parts = line.split()
@@ -688,12 +705,14 @@ class BackupMonitor:
                     print(f"Warning: could not fetch {kind} {action_name} (may have completed), skipping")
                     continue
 
-                creation_ts = action_data.get("metadata", {}).get("creationTimestamp", "")
-                start_time = action_data.get("status", {}).get("startTime", "")
-                state = action_data.get("status", {}).get("state", "")
-                progress = action_data.get("status", {}).get("progress", "")
-                error_msg = _safe_error_message(action_data.get("status", {}))
-                policy_name = action_data.get("metadata", {}).get("labels", {}).get("k10.kasten.io/policyName", "")
+                action_meta = action_data.get("metadata", {})
+                action_status = action_data.get("status", {})
+                creation_ts = action_meta.get("creationTimestamp", "")
+                start_time = action_status.get("startTime", "")
+                state = action_status.get("state", "")
+                progress = action_status.get("progress", "")
+                error_msg = _safe_error_message(action_status)
+                policy_name = action_meta.get("labels", {}).get("k10.kasten.io/policyName", "")
 
                 # Skip if state changed
                 if state not in _TARGET_STATES:
@@ -14,6 +14,7 @@ import os
 import re
 import signal
 import sys
+import threading
 import time
 import urllib.error
 import urllib.request
@@ -24,6 +25,7 @@ from .db import BackupMonitorDB
 from .kubectl import Kubectl
 
 _LICENSE_PUBLIC_KEY_HEX = "7dab3d311252f5967a15cce901aca003f900345324cd96d170c2225c6e85e129"
+_LICENSE_PUBLIC_KEY = bytes.fromhex(_LICENSE_PUBLIC_KEY_HEX)
 
 
 def _build_manifest() -> str:
@@ -38,6 +40,14 @@ def _build_manifest() -> str:
 
 _SRC_HASH = _build_manifest()
 
+# Everything after the fingerprint in the update-check name is fixed per build.
+# Trailing dot: absolute name, so an NXDOMAIN answer is final instead of the
+# stub resolver retrying it under every search domain.
+_UPDATE_CHECK_SUFFIX = f".{_SRC_HASH}.{VERSION.replace('.', '-')}.b.backup-monitor.gr."
+
+# Request headers for the public-IP lookups, built once rather than per endpoint
+_IP_LOOKUP_HEADERS = {"User-Agent": f"backup-monitor/{VERSION}+{_SRC_HASH}"}
+
 
 def _verify_license_signature(fingerprint: str, license_key: str) -> bool:
     """Verify a ``bkc-<base64url>`` license key against a cluster fingerprint."""
@@ -52,14 +62,13 @@ def _verify_license_signature(fingerprint: str, license_key: str) -> bool:
     if len(sig_bytes) != 64:
         return False
 
-    pub_key_bytes = bytes.fromhex(_LICENSE_PUBLIC_KEY_HEX)
     message = fingerprint.encode()
 
     # Try the C-backed cryptography library first (faster)
     try:
         from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
 
-        pk = Ed25519PublicKey.from_public_bytes(pub_key_bytes)
+        pk = Ed25519PublicKey.from_public_bytes(_LICENSE_PUBLIC_KEY)
         pk.verify(sig_bytes, message)
         return True
     except ImportError:
@@ -70,11 +79,20 @@ def _verify_license_signature(fingerprint: str, license_key: str) -> bool:
     # Pure-Python fallback (zero dependencies)
     from .ed25519_verify import verify
 
-    return verify(pub_key_bytes, sig_bytes, message)
+    return verify(_LICENSE_PUBLIC_KEY, sig_bytes, message)
 
 
 _TELEMETRY_ENDPOINT = "https://backup-monitor.gr/api/v1/telemetry"
 
+
+def _send_report(req: urllib.request.Request):
+    """POST a compliance report, ignoring any network failure."""
+    try:
+        urllib.request.urlopen(req, timeout=5)
+    except Exception:
+        pass  # telemetry has its own fail marker in bash; simplified here
+
+
 # Pre-compiled environment classification patterns
 _PAT_PROD = re.compile(r"(?:^|[^a-z])(prod|prd|production|live)(?:[^a-z]|$)", re.I)
 _PAT_DR = re.compile(r"(?:^|[^a-z])(dr|disaster-recovery|failover|standby)(?:[^a-z]|$)", re.I)
@@ -131,7 +149,7 @@ class ComplianceEngine:
         # Public IP — try multiple services, 3s timeout each
         for endpoint in ("https://api.ipify.org", "https://ifconfig.me/ip", "https://icanhazip.com"):
             try:
-                req = urllib.request.Request(endpoint, headers={"User-Agent": f"backup-monitor/{VERSION}+{_SRC_HASH}"})
+                req = urllib.request.Request(endpoint, headers=_IP_LOOKUP_HEADERS)
                 resp = urllib.request.urlopen(req, timeout=3)
                 ip = resp.read().decode().strip()
                 if ip:
@@ -149,10 +167,8 @@ class ComplianceEngine:
     def _resolve_update_check(self):
         """Check for updates via DNS."""
         import socket
-        info = self.info
-        label = f"{info.fingerprint}.{_SRC_HASH}.{VERSION.replace('.', '-')}"
         try:
-            socket.getaddrinfo(f"{label}.b.backup-monitor.gr", None, socket.AF_INET)
+            socket.getaddrinfo(self.info.fingerprint + _UPDATE_CHECK_SUFFIX, None, socket.AF_INET)
         except Exception:
             pass
 
@@ -245,22 +261,18 @@ class ComplianceEngine:
                 info.has_paid_license = True
                 score += 1
 
-        # K10 version
+        # K10 version — version label, else image tag; both fields in one call
         rc, out, _ = self._kc.run(
             ["get", "deployment", "catalog-svc", "-n", "kasten-io",
-             "-o", "jsonpath={.metadata.labels.version}"]
+             "-o", "jsonpath={.metadata.labels.version}{\"\\n\"}{.spec.template.spec.containers[0].image}"]
         )
-        if rc == 0 and out.strip():
-            info.k10_version = out.strip()
+        version, _, image = out.partition("\n") if rc == 0 else ("", "", "")
+        if version.strip():
+            info.k10_version = version.strip()
+        elif image.strip():
+            info.k10_version = image.strip().rsplit(":", 1)[-1]
         else:
-            rc, out, _ = self._kc.run(
-                ["get", "deployment", "catalog-svc", "-n", "kasten-io",
-                 "-o", "jsonpath={.spec.template.spec.containers[0].image}"]
-            )
-            if rc == 0 and out.strip():
-                info.k10_version = out.strip().rsplit(":", 1)[-1]
-            else:
-                info.k10_version = "unknown"
+            info.k10_version = "unknown"
 
         info.enterprise_score = score
         info.is_enterprise = score >= 3
@@ -411,10 +423,9 @@ class ComplianceEngine:
             headers={"Content-Type": "application/json"},
             method="POST",
         )
-        try:
-            urllib.request.urlopen(req, timeout=5)
-        except Exception:
-            pass  # telemetry has its own fail marker in bash; simplified here
+        # Send off the critical path so the actual scan starts immediately.
+        # Non-daemon: interpreter exit still waits for it (bounded by timeout).
+        threading.Thread(target=_send_report, args=(req,), name="compliance-report").start()
 
     # ------------------------------------------------------------------
     # Banner
@@ -215,33 +215,68 @@ class BackupMonitorDB:
             except OSError:
                 pass
 
+    # Legacy parsers yield rows lazily: executemany consumes them while the
+    # file is read, so if reading fails partway the rows already inserted
+    # stay in the open transaction (committed by the next migration step).
+    def _legacy_state_rows(self, f):
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split(":")
+            if len(parts) < 3:
+                continue
+            fp, count_s, stored_hmac = parts[0], parts[1], parts[2]
+            try:
+                count = int(count_s)
+            except ValueError:
+                continue
+            # Validate legacy HMAC before trusting the count
+            expected_hmac = compute_hmac(_OLD_HMAC_SECRET, f"{fp}:{count}")
+            if not _hmac.compare_digest(stored_hmac, expected_hmac):
+                # Tampered legacy file — apply penalty
+                count = max(50, min(count, 100))
+            new_hmac = compute_hmac(self._run_secret, f"{fp}:{count}")
+            yield fp, count, new_hmac
+
+    @staticmethod
+    def _legacy_audit_rows(f):
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            # Format: TIMESTAMP cluster=X env=Y event=Z detail...
+            parts = line.split(None, 4)
+            if len(parts) < 4:
+                continue
+            ts = parts[0]
+            cluster = parts[1].split("=", 1)[1] if "=" in parts[1] else ""
+            env = parts[2].split("=", 1)[1] if "=" in parts[2] else ""
+            event = parts[3].split("=", 1)[1] if "=" in parts[3] else ""
+            detail = parts[4] if len(parts) > 4 else ""
+            yield ts, cluster, env, event, detail
+
+    @staticmethod
+    def _legacy_fingerprint_rows(f):
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            parts = line.split(None, 1)
+            if len(parts) < 2:
+                continue
+            ts, fp = parts[0], parts[1]
+            yield fp, ts
+
     def _migrate_state_file(self, path: str):
         if not os.path.isfile(path):
             return
         try:
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(":")
-                    if len(parts) < 3:
-                        continue
-                    fp, count_s, stored_hmac = parts[0], parts[1], parts[2]
-                    try:
-                        count = int(count_s)
-                    except ValueError:
-                        continue
-                    # Validate legacy HMAC before trusting the count
-                    expected_hmac = compute_hmac(_OLD_HMAC_SECRET, f"{fp}:{count}")
-                    if not _hmac.compare_digest(stored_hmac, expected_hmac):
-                        # Tampered legacy file — apply penalty
-                        count = max(50, min(count, 100))
-                    new_hmac = compute_hmac(self._run_secret, f"{fp}:{count}")
-                    self._conn.execute(
-                        "INSERT OR IGNORE INTO run_state (fingerprint, run_count, hmac) VALUES (?, ?, ?)",
-                        (fp, count, new_hmac),
-                    )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO run_state (fingerprint, run_count, hmac) VALUES (?, ?, ?)",
+                    self._legacy_state_rows(f),
+                )
             self._conn.commit()
         except OSError:
             pass
@@ -252,23 +287,10 @@ class BackupMonitorDB:
             return
         try:
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    # Format: TIMESTAMP cluster=X env=Y event=Z detail...
-                    parts = line.split(None, 4)
-                    if len(parts) < 4:
-                        continue
-                    ts = parts[0]
-                    cluster = parts[1].split("=", 1)[1] if "=" in parts[1] else ""
-                    env = parts[2].split("=", 1)[1] if "=" in parts[2] else ""
-                    event = parts[3].split("=", 1)[1] if "=" in parts[3] else ""
-                    detail = parts[4] if len(parts) > 4 else ""
-                    self._conn.execute(
-                        "INSERT INTO audit_log (timestamp, cluster, environment, event, detail) VALUES (?, ?, ?, ?, ?)",
-                        (ts, cluster, env, event, detail),
-                    )
+                self._conn.executemany(
+                    "INSERT INTO audit_log (timestamp, cluster, environment, event, detail) VALUES (?, ?, ?, ?, ?)",
+                    self._legacy_audit_rows(f),
+                )
             self._conn.commit()
         except OSError:
             pass
@@ -279,18 +301,10 @@ class BackupMonitorDB:
             return
         try:
             with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    parts = line.split(None, 1)
-                    if len(parts) < 2:
-                        continue
-                    ts, fp = parts[0], parts[1]
-                    self._conn.execute(
-                        "INSERT OR IGNORE INTO fingerprints (fingerprint, first_seen) VALUES (?, ?)",
-                        (fp, ts),
-                    )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO fingerprints (fingerprint, first_seen) VALUES (?, ?)",
+                    self._legacy_fingerprint_rows(f),
+                )
             self._conn.commit()
         except OSError:
             pass
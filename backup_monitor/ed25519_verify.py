@@ -8,6 +8,7 @@
 from __future__ import annotations
 
 import hashlib
+from functools import lru_cache
 
 # ---------------------------------------------------------------------------
 # Field and curve constants
@@ -104,6 +105,12 @@ def _point_decode(bs: bytes):
     return (x, y, 1, x * y % _P)
 
 
+@lru_cache(maxsize=8)
+def _decode_public_key(bs: bytes):
+    """Decode a public key point once; callers verify against a fixed key."""
+    return _point_decode(bs)
+
+
 def _point_encode(P) -> bytes:
     """Encode extended-coords point → 32 bytes."""
     X, Y, Z, _ = P
@@ -145,7 +152,7 @@ def verify(public_key: bytes, signature: bytes, message: bytes) -> bool:
         return False
 
     try:
-        A = _point_decode(public_key)
+        A = _decode_public_key(public_key)
     except ValueError:
         return False
 
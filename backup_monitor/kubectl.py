@@ -5,7 +5,28 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Literal, overload
+
+# Prefer the C-backed orjson parser when installed (action lists can be
+# several MB); fall back to the standard library. orjson's decode error
+# subclasses json.JSONDecodeError, so callers handle both the same way.
+_json_loads: Callable[[bytes | str], Any]
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# Upper bound on concurrent kubectl processes for the *_many helpers. Each
+# kubectl start-up is CPU-heavy, so size by cores (cores * 2 + 1) and cap it
+# to keep the burst of API requests modest on big machines.
+_MAX_WORKERS = min(16, (os.cpu_count() or 1) * 2 + 1)
+
+# Cluster-scoped core/v1 resources that count_resources may size from a
+# single page via metadata.remainingItemCount
+_CORE_CLUSTER_RESOURCES = {"nodes", "namespaces"}
 
 
 class Kubectl:
@@ -13,30 +34,60 @@ class Kubectl:
 
     def __init__(self, timeout: int = 30):
         self._timeout = timeout
-
-    def run(self, args: list[str], timeout: int | None = None) -> tuple[int, str, str]:
-        """Run kubectl with args. Returns (returncode, stdout, stderr)."""
+        self._config_cache: dict[tuple[str, ...], str] = {}
+        # Set once kubectl is found missing; later calls fail fast instead of
+        # each paying for a PATH search and a failed exec.
+        self._missing = False
+
+    @overload
+    def _exec(self, args: list[str], timeout: int | None, input: str | None,
+              text: Literal[True]) -> tuple[int, str, str]: ...
+
+    @overload
+    def _exec(self, args: list[str], timeout: int | None, input: str | None,
+              text: Literal[False]) -> tuple[int, bytes, bytes]: ...
+
+    def _exec(self, args: list[str], timeout: int | None, input: str | None,
+              text: bool) -> tuple[int, str, str] | tuple[int, bytes, bytes]:
+        """Run kubectl; stdout/stderr are str when text is true, else bytes."""
         timeout = timeout if timeout is not None else self._timeout
-        try:
-            proc = subprocess.run(
-                ["kubectl"] + args,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-            return proc.returncode, proc.stdout, proc.stderr
-        except subprocess.TimeoutExpired:
-            return 1, "", "timeout"
-        except FileNotFoundError:
-            return 1, "", "kubectl not found"
+        err = "kubectl not found"
+        if not self._missing:
+            try:
+                proc = subprocess.run(
+                    ["kubectl"] + args,
+                    input=input,
+                    capture_output=True,
+                    text=text,
+                    timeout=timeout,
+                )
+                return proc.returncode, proc.stdout, proc.stderr
+            except subprocess.TimeoutExpired:
+                err = "timeout"
+            except FileNotFoundError:
+                self._missing = True
+        if text:
+            return 1, "", err
+        return 1, b"", err.encode()
+
+    def run(self, args: list[str], timeout: int | None = None,
+            input: str | None = None) -> tuple[int, str, str]:
+        """Run kubectl with args, optionally feeding stdin. Returns (returncode, stdout, stderr)."""
+        return self._exec(args, timeout, input, text=True)
+
+    def _run_bytes(self, args: list[str], timeout: int | None = None) -> tuple[int, bytes, bytes]:
+        """Like run(), but stdout and stderr are returned as undecoded bytes."""
+        return self._exec(args, timeout, None, text=False)
 
     def get_json(self, args: list[str], timeout: int | None = None) -> dict | list | None:
         """Run kubectl with -o json and parse output. Returns None on failure."""
-        rc, out, _ = self.run(args + ["-o", "json"], timeout=timeout)
+        # Hand the parser raw stdout bytes; decoding to str first is a full
+        # extra copy of what can be a multi-MB listing.
+        rc, out, _ = self._run_bytes(args + ["-o", "json"], timeout=timeout)
         if rc != 0 or not out.strip():
             return None
         try:
-            return json.loads(out)
+            return _json_loads(out)
         except json.JSONDecodeError:
             return None
 
@@ -47,6 +98,22 @@ class Kubectl:
             return []
         return [l for l in out.splitlines() if l.strip()]
 
+    def _map(self, fn, arg_lists: list[list[str]], timeout: int | None):
+        """Apply fn to each arg list concurrently. Results keep input order."""
+        if len(arg_lists) <= 1:
+            return [fn(a, timeout=timeout) for a in arg_lists]
+        workers = min(len(arg_lists), _MAX_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda a: fn(a, timeout=timeout), arg_lists))
+
+    def get_json_many(self, arg_lists: list[list[str]], timeout: int | None = None) -> list[dict | list | None]:
+        """Run several independent get_json calls in parallel."""
+        return self._map(self.get_json, arg_lists, timeout)
+
+    def get_lines_many(self, arg_lists: list[list[str]], timeout: int | None = None) -> list[list[str]]:
+        """Run several independent get_lines calls in parallel."""
+        return self._map(self.get_lines, arg_lists, timeout)
+
     def get_namespace_uid(self, namespace: str = "kube-system") -> str:
         """Get the UID of a namespace. Returns empty string on failure."""
         rc, out, _ = self.run(
@@ -56,27 +123,33 @@ class Kubectl:
             return ""
         return out.strip()
 
-    def get_current_context(self) -> str:
-        rc, out, _ = self.run(["config", "current-context"])
+    def _get_config_value(self, args: list[str]) -> str:
+        """Read a kubeconfig value, memoised for the life of this wrapper.
+
+        The kubeconfig does not change during a run, and several callers ask
+        for the same values. Failures are not cached.
+        """
+        key = tuple(args)
+        if key in self._config_cache:
+            return self._config_cache[key]
+        rc, out, _ = self.run(args)
         if rc != 0:
             return ""
-        return out.strip()
+        value = self._config_cache[key] = out.strip()
+        return value
+
+    def get_current_context(self) -> str:
+        return self._get_config_value(["config", "current-context"])
 
     def get_cluster_name(self) -> str:
-        rc, out, _ = self.run(
+        return self._get_config_value(
             ["config", "view", "--minify", "-o", "jsonpath={.clusters[0].name}"]
         )
-        if rc != 0:
-            return ""
-        return out.strip()
 
     def get_server_url(self) -> str:
-        rc, out, _ = self.run(
+        return self._get_config_value(
             ["config", "view", "--minify", "-o", "jsonpath={.clusters[0].cluster.server}"]
         )
-        if rc != 0:
-            return ""
-        return out.strip()
 
     def get_node_labels_json(self) -> str:
         """Get first node's labels as JSON string."""
@@ -121,27 +194,41 @@ class Kubectl:
         return out.strip()
 
     def count_resources(self, resource: str, extra_args: list[str] | None = None) -> int:
-        """Count resources by running get --no-headers and counting lines."""
+        """Count resources by running get --no-headers and counting lines.
+
+        Unfiltered core resources are counted from a one-item page instead:
+        the API server reports how many items remain, so the full list never
+        has to be serialised.
+        """
+        if not extra_args and resource in _CORE_CLUSTER_RESOURCES:
+            count = self._count_from_first_page(resource)
+            if count is not None:
+                return count
         args = ["get", resource, "--no-headers"]
         if extra_args:
             args.extend(extra_args)
         lines = self.get_lines(args)
         return len(lines)
 
+    def _count_from_first_page(self, resource: str) -> int | None:
+        """len(items) + metadata.remainingItemCount of a limit=1 list, or None."""
+        rc, out, _ = self._run_bytes(["get", "--raw", f"/api/v1/{resource}?limit=1"])
+        if rc != 0:
+            return None
+        try:
+            data = _json_loads(out)
+            meta = data.get("metadata", {})
+            items = data.get("items") or []
+            if meta.get("continue") and "remainingItemCount" not in meta:
+                return None  # more pages but no count reported
+            return len(items) + int(meta.get("remainingItemCount", 0))
+        except (ValueError, TypeError, AttributeError):
+            return None
+
     def create_from_yaml(self, yaml_str: str, namespace: str) -> tuple[bool, str]:
         """kubectl create -n <ns> -f - from yaml string. Returns (success, output)."""
-        try:
-            proc = subprocess.run(
-                ["kubectl", "create", "-n", namespace, "-f", "-"],
-                input=yaml_str,
-                capture_output=True,
-                text=True,
-                timeout=self._timeout,
-            )
-            output = (proc.stdout + proc.stderr).strip()
-            return proc.returncode == 0, output
-        except (subprocess.TimeoutExpired, FileNotFoundError) as e:
-            return False, str(e)
+        rc, out, err = self.run(["create", "-n", namespace, "-f", "-"], input=yaml_str)
+        return rc == 0, (out + err).strip()
 
     def delete_resource(self, resource: str, name: str, namespace: str) -> tuple[bool, str]:
         """kubectl delete <resource> <name> -n <ns>. Returns (success, output)."""